@@ -44,26 +44,34 @@ Market data & offline fallbacks
   - If download fails, the BTC outflow falls back to an evenly spread USD total
     (`BTC_USD_TOTAL_MM`) across the window (units/price left NaN for diagnostics).
 
+• Cache: both series are saved to parquet (zstd) in `OUT_DIR` and served from disk
+  when they cover the requested range; if FRED fails, cached observations are used
+  before falling back to the constant rate.
+
 Core mechanics
 --------------
 1) Build quarter calendar: `build_quarter_frame_with_forecast(forecast_quarters, quarter_days)`
    creates historical quarters from anchors and appends N forecast quarters (~13 weeks each).
 
-2) For each quarter:
+2) Lay dated events and daily BTC cash flows on one daily grid spanning all quarters and
+   reduce it to per-quarter accrual terms in a single vectorized pass
+   (`quarter_accrual_terms`), then carry liquidity across quarters (`carry_quarters`):
    - Start liquidity = prior quarter’s carry (reported end_liq for historical,
      **end_liq + modeled interest** for forecasts).
-   - Apply dated events and daily BTC cash flows.
    - Apply a constant "residual drift" so the day-by-day path exactly hits the known
      `end_liq` on quarter end for reported quarters. For forecasts, drift = 0 by design.
-   - Join daily rates and accrue interest = ending_balance * daily_rate; sum to quarter.
+   - Accrue interest = ending_balance * daily_rate summed over the quarter, evaluated
+     from the precomputed terms (the balance path is affine in start_liq and drift).
 
 3) BTC diagnostics:
    - Track units purchased within the BTC window, end-of-quarter holdings, end-of-quarter
      fair value, and quarterly BTC earnings = FV_end − (FV_beg + cost_of_new_purchases).
-   - Prefetch BTC closes once for all quarter ends (`prefetch_btc_closes`) to value holdings.
+   - Fetch BTC prices once (`fetch_btc_prices`) and reuse them for the purchase window
+     and for quarter-end closes (`prefetch_btc_closes`) to value holdings.
 
-4) Output rows (one per quarter) are accumulated in `results` and converted into a
-   DataFrame with additional diagnostics and error metrics.
+4) Outputs (one row per quarter) are written into preallocated typed columns
+   (`RESULT_COLUMNS`), converted into a DataFrame, rounded in one pass (`ROUND_SPEC`),
+   and extended with additional diagnostics and error metrics.
 
 Forecast carry & totals
 -----------------------
@@ -88,18 +96,32 @@ Key functions
 
 • `fetch_rates(start, end) -> pd.DataFrame`
     DGS3MO (%), reindexed to full daily range with no NaNs, plus `daily_rate`.
+    Cached per series to `OUT_DIR/<series>.parquet` (e.g. dgs3mo.parquet, zstd) and
+    reused when the range is covered.
+
+• `fetch_btc_prices(start, end) -> pd.DataFrame`
+    BTC-USD daily close and HLC3 from one Yahoo download (empty if it fails).
+    Cached to `OUT_DIR/btc_usd.parquet` (zstd) like the rates.
 
 • `btc_outflow_series(start, end, ...) -> pd.DataFrame`
     Daily BTC cash outflows (USD mm negative), units/day, price, fee multiplier.
 
-• `prefetch_btc_closes(q_end_dates) -> pd.Series`
+• `prefetch_btc_closes(q_end_dates, btc_prices=None) -> pd.Series`
     BTC-USD close mapped to each quarter end (for holdings valuation).
 
-• `build_daily_path(QuarterInputs, rates) -> (pd.DataFrame, float)`
+• `quarter_accrual_terms(flows, daily_rate, seg_starts) -> QuarterTerms`
+    Per-quarter sums (flows, rates, flow·rate) from which interest and average balance
+    follow for any start liquidity and drift.
+
+• `carry_quarters(QuarterTerms, reported_end) -> QuarterAccruals`
+    Compiled quarter-to-quarter carry: start/end liquidity, drift, modeled interest and
+    average balance for every quarter.
+
+• `build_daily_path(QuarterInputs, daily_rate) -> (pd.DataFrame, float)`
     Daily path with events/BTC/drift, then daily interest accrual; returns daily detail
-    and the quarter’s modeled interest (USD mm).
+    and the quarter’s modeled interest (USD mm). Used for the daily parquet export.
 
-• `simulate_all(..., forecast_quarters=1) -> pd.DataFrame`
+• `simulate_all(..., forecast_quarters=1, quiet=False) -> pd.DataFrame`
     Full backtest + multi-quarter forecast, returns the per-quarter results DataFrame
     and writes a CSV to `OUT_DIR`.
 
@@ -108,17 +130,21 @@ Configuration knobs
 • `FRED_SERIES`, `DAYCOUNT`, `DEFAULT_OFFLINE_RATE_PCT`
 • `ATM_NET_TO_GROSS` (scales gross ATM proceeds to approximate net)
 • `BTC_FEE_BPS`, `BTC_PRICE_BASIS`, `BTC_USD_TOTAL_MM`
-• `MAKE_DAILY_PARQUETS`, `OUT_DIR`
+• `MAKE_DAILY_PARQUETS`, `MAKE_RESULTS_PARQUET`, `OUT_DIR`
+• `USE_MARKET_DATA_CACHE`, `CACHE_STALE_DAYS` (parquet cache of FRED/Yahoo series)
+• `PARALLEL_ACCRUAL` (multi-threaded accrual kernel; read on each call)
 • `forecast_quarters` (how far ahead to extend)
 
 Outputs
 -------
 • CSV: `gme_interest_backtest_results.csv` in `OUT_DIR`
-• Optional per-quarter daily parquet files (if `MAKE_DAILY_PARQUETS=True`)
+• Optional parquet copy of the same table, zstd-compressed (if `MAKE_RESULTS_PARQUET=True`)
+• Optional per-quarter daily parquet files, zstd-compressed (if `MAKE_DAILY_PARQUETS=True`)
 • Console summary:
   - Backtest MAPE/sMAPE
   - Implied annualized yields vs 3M (recent reported quarters)
   - Forecast quarter implied yield vs 3M
+  (the two yield tables are skipped with `simulate_all(..., quiet=True)`)
 
 Limitations & notes
 -------------------
@@ -139,23 +165,37 @@ or call `simulate_all(forecast_quarters=N)` from another script or notebook.
 Dependencies
 ------------
 pandas, numpy, pandas_datareader, yfinance, python-dateutil
+Optional: numba (JIT-compiles the accrual kernel), bottleneck (summary metrics), pyarrow (parquet cache & daily files)
 """
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-# External data sources (fetched at runtime)
-from pandas_datareader import data as pdr  # FRED
-import yfinance as yf                      # BTC-USD
+# External data sources (pandas_datareader for FRED, yfinance for BTC-USD) are
+# imported inside the fetchers: they are slow to import and unused on cache hits.
 from pathlib import Path
 import traceback
 
+try:
+    from numba import njit, prange  # JIT for the accrual kernel
+except ImportError:                 # optional: kernels run as plain Python without numba
+    prange = range
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+try:
+    from bottleneck import nanmean  # single-pass NaN-aware reductions
+except ImportError:                 # optional: NumPy's nanmean gives the same result
+    from numpy import nanmean
+
 # -----------------------------
 # Configuration
 # -----------------------------
@@ -164,9 +204,15 @@ FRED_SERIES = "DGS3MO"   # 3M T-bill yield (%)
 DAYCOUNT = 365.0         # ACT/365F
 ATM_NET_TO_GROSS = 0.995 # Scale gross ATM proceeds to approximate net (set 1.0 to use gross)
 MAKE_DAILY_PARQUETS = False
+MAKE_RESULTS_PARQUET = False                         # also save the results table as parquet (typed, for downstream use)
 OUT_DIR = Path(r"")
 DEFAULT_OFFLINE_RATE_PCT = 5.0                       # fallback if FRED blocked
 BTC_USD_TOTAL_MM = 510.0                             # fallback total spend if Yahoo blocked (USD millions)
+USE_MARKET_DATA_CACHE = True                         # reuse FRED/Yahoo series saved as parquet in OUT_DIR
+RATES_CACHE_FILE = "{series}.parquet"                # one file per FRED_SERIES (e.g. dgs3mo.parquet)
+BTC_CACHE_FILE = "btc_usd.parquet"
+CACHE_STALE_DAYS = 5                                 # longest tolerated gap in cached data (weekends, holidays, publication lag)
+PARALLEL_ACCRUAL = False                             # numba threads over quarters (thread start-up outweighs ~16 quarters of work)
 
 # -----------------------------
 # Utility functions
@@ -175,6 +221,17 @@ BTC_USD_TOTAL_MM = 510.0                             # fallback total spend if Y
 def to_dt(s: str) -> pd.Timestamp:
     return pd.Timestamp(s).normalize()
 
+def day_offsets(dates, origin: pd.Timestamp) -> np.ndarray:
+    """Whole days from `origin` to each of `dates` (int64), for indexing daily arrays."""
+    return (np.asarray(dates, dtype="datetime64[D]")
+            - np.datetime64(origin.normalize().date(), "D")).astype(np.int64)
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create `path` (with parents) once per process; later calls skip the syscall."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 # -----------------------------
 # Domain data
 # -----------------------------
@@ -247,7 +304,12 @@ def dated_events(net_to_gross: float = ATM_NET_TO_GROSS) -> pd.DataFrame:
     """
     Dated capital flows (USD millions). Positive = cash inflow, Negative = outflow.
     BTC purchases are modeled separately (because they span a range of days).
+    Memoized per `net_to_gross`; callers get their own copy.
     """
+    return _dated_events(float(net_to_gross)).copy()
+
+@lru_cache(maxsize=None)
+def _dated_events(net_to_gross: float) -> pd.DataFrame:
     rows = [
         # ATMs (2024)
         {"date": "2024-05-24", "amount":  933.4 * net_to_gross, "label": "ATM (45M shares) gross~net"},
@@ -269,11 +331,17 @@ def build_quarter_frame_with_forecast(forecast_quarters: int = 1,
     """
     Build quarter frames from the liquidity anchors and append `forecast_quarters`
     additional quarters (default ≈13 weeks each via `quarter_days`).
+    Memoized per arguments and current anchor dates; callers get their own copy.
     """
-    ends = sorted([to_dt(k) for k in quarter_end_liquidity().keys()])
+    anchors = tuple(sorted(quarter_end_liquidity()))
+    return _quarter_frame(anchors, max(int(forecast_quarters), 0), int(quarter_days)).copy()
+
+@lru_cache(maxsize=None)
+def _quarter_frame(anchors: Tuple[str, ...], forecast_quarters: int, quarter_days: int) -> pd.DataFrame:
+    ends = sorted([to_dt(k) for k in anchors])
 
     # append N forecast quarter-ends
-    for _ in range(max(int(forecast_quarters), 0)):
+    for _ in range(forecast_quarters):
         next_end = (ends[-1] + pd.Timedelta(days=quarter_days)).normalize()
         ends.append(next_end)
 
@@ -294,13 +362,64 @@ def build_quarter_frame_with_forecast(forecast_quarters: int = 1,
 # Market data fetchers
 # -----------------------------
 
-def fetch_rates(start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
-    """FRED DGS3MO (%). Returns a daily index from start..end with no NaNs."""
+def _read_cache(name: str) -> Optional[pd.DataFrame]:
+    """Cached market series from OUT_DIR, or None if caching is off or the file is unusable."""
+    path = OUT_DIR / name
+    if not USE_MARKET_DATA_CACHE or not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path, engine="pyarrow")
+    except Exception as e:
+        print(f"[WARN] cache read failed ({path}): {e}")
+        return None
+
+def _cache_covers(cached: Optional[pd.DataFrame], start: pd.Timestamp, end: pd.Timestamp) -> bool:
+    """
+    True if the cached observations cover [start, end] without holes. Series only have
+    observations up to yesterday (and not on weekends/holidays for FRED), so any step
+    between start, consecutive cached dates and end may be up to CACHE_STALE_DAYS.
+    The cache merges every range fetched so far, so a longer step inside the window is
+    a hole between two earlier fetches and counts as a miss.
+    """
+    if cached is None or cached.empty:
+        return False
+    lo = start.normalize()
+    hi = max(min(end.normalize(), pd.Timestamp.today().normalize()), lo)
+    inside = cached.index[(cached.index >= lo) & (cached.index <= hi)]
+    steps = np.diff(np.concatenate(([0], day_offsets(inside, lo), [day_offsets(hi, lo)])))
+    return bool(steps.max() <= CACHE_STALE_DAYS)
+
+def _write_cache(name: str, fresh: pd.DataFrame, cached: Optional[pd.DataFrame]) -> None:
+    """Merge freshly fetched observations into the cache (fresh wins) and save as parquet/zstd."""
+    if not USE_MARKET_DATA_CACHE or fresh.empty:
+        return
+    merged = fresh if cached is None else pd.concat([cached, fresh])
+    merged = merged[~merged.index.duplicated(keep="last")].sort_index()
     try:
-        r = pdr.DataReader(FRED_SERIES, "fred", start, end).rename(columns={FRED_SERIES: "rate_pct"})
+        _ensure_dir(OUT_DIR)
+        merged.to_parquet(OUT_DIR / name, engine="pyarrow", compression="zstd", compression_level=9)
     except Exception as e:
-        print(f"[WARN] FRED fetch failed: {e}\n{traceback.format_exc()}")
-        r = pd.DataFrame({"rate_pct": []})
+        print(f"[WARN] cache write failed ({OUT_DIR / name}): {e}")
+
+def fetch_rates(start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """
+    FRED DGS3MO (%). Returns a daily index from start..end with no NaNs.
+    Served from the parquet cache when it covers the range; otherwise fetched and cached.
+    """
+    cache_file = RATES_CACHE_FILE.format(series=FRED_SERIES.lower())
+    cached = _read_cache(cache_file)
+    if _cache_covers(cached, start, end):
+        r = cached.loc[start.normalize():end.normalize(), ["rate_pct"]]
+    else:
+        try:
+            from pandas_datareader import data as pdr  # FRED
+            r = pdr.DataReader(FRED_SERIES, "fred", start, end).rename(columns={FRED_SERIES: "rate_pct"})
+            _write_cache(cache_file, r[["rate_pct"]].dropna().astype(float), cached)
+        except Exception as e:
+            print(f"[WARN] FRED fetch failed: {e}\n{traceback.format_exc()}")
+            # partial cache beats the constant offline rate
+            r = (cached.loc[start.normalize():end.normalize(), ["rate_pct"]] if cached is not None
+                 else pd.DataFrame({"rate_pct": []}))
 
     all_days = pd.date_range(start.normalize(), end.normalize(), freq="D")
     r = r.reindex(all_days)
@@ -326,34 +445,88 @@ def apply_future_rate_events(rates: pd.DataFrame,
     if not events:
         return rates
 
-    out = rates.copy()
-    out["rate_pct"] = pd.to_numeric(out.get("rate_pct"), errors="coerce") \
-                        .fillna(DEFAULT_OFFLINE_RATE_PCT)
+    arr = pd.to_numeric(rates.get("rate_pct"), errors="coerce") \
+            .fillna(DEFAULT_OFFLINE_RATE_PCT).to_numpy(dtype=float, copy=True)
 
     def _to_dt(x: str) -> pd.Timestamp:
         return pd.Timestamp(x).normalize()
 
-    for ev in sorted(events, key=lambda e: _to_dt(e["date"])):
-        eff = _to_dt(ev["date"])
-        mask = out.index >= eff
-        if not mask.any():
-            continue
+    evs = sorted(events, key=lambda e: _to_dt(e["date"]))
+    # position of each effective date; event k governs arr[pos[k]:pos[k+1]]
+    pos = rates.index.searchsorted(pd.DatetimeIndex([_to_dt(ev["date"]) for ev in evs]))
+    level = None   # absolute level from the latest 'to_pct' (None = follow the fetched series)
+    shift = 0.0    # accumulated 'delta_bps' since then, in percent
+    for k, ev in enumerate(evs):
         has_delta = "delta_bps" in ev and ev["delta_bps"] is not None
         has_abs   = "to_pct" in ev and ev["to_pct"] is not None
         if has_delta and has_abs:
             raise ValueError("Specify either 'delta_bps' or 'to_pct', not both.")
         if has_abs:
-            out.loc[mask, "rate_pct"] = float(ev["to_pct"])
+            level, shift = float(ev["to_pct"]), 0.0
         elif has_delta:
-            out.loc[mask, "rate_pct"] = out.loc[mask, "rate_pct"] + float(ev["delta_bps"]) / 100.0
+            shift += float(ev["delta_bps"]) / 100.0
+        seg = slice(pos[k], pos[k + 1] if k + 1 < len(evs) else len(arr))
+        arr[seg] = (arr[seg] if level is None else level) + shift
 
-    out["daily_rate"] = (out["rate_pct"] / 100.0) / DAYCOUNT
-    return out
+    return rates.assign(rate_pct=arr, daily_rate=(arr / 100.0) / DAYCOUNT)
 
 # --- BTC execution assumptions ---
 BTC_FEE_BPS = 150          # uplift on spend in basis points (≈1.30%); tweak to match "just over $500m"
 BTC_PRICE_BASIS = "close"  # "close" or "hlc3" (avg of High/Low/Close) to approximate intraday execution
 
+def fetch_btc_prices(start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """
+    BTC-USD daily prices from Yahoo in a single download, on a complete daily index
+    (forward-filled): 'close' and 'hlc3' (avg of High/Low/Close).
+    Served from the parquet cache when it covers the range; otherwise downloaded and cached.
+    Returns an empty frame if the download fails so callers can fall back without
+    hitting the network again.
+    """
+    cached = _read_cache(BTC_CACHE_FILE)
+    if _cache_covers(cached, start, end - pd.Timedelta(days=1)):   # 'end' is exclusive
+        return cached.loc[start.normalize():end.normalize() - pd.Timedelta(days=1)]
+
+    try:
+        import yfinance as yf  # BTC-USD
+        df = yf.download(
+            "BTC-USD",
+            start=start.date(),
+            end=end.date(),                      # yfinance 'end' is exclusive
+            progress=False,
+            auto_adjust=False,
+        )
+        if df is None or df.empty:
+            raise RuntimeError("empty BTC-USD frame")
+
+        # --- Normalize whatever yfinance returned into 1-D Series per field ---
+        def _field(name: str) -> Optional[pd.Series]:
+            if isinstance(df.columns, pd.MultiIndex):
+                if name not in df.columns.get_level_values(0):
+                    return None
+                tmp = df.xs(name, axis=1, level=0)
+                return tmp.iloc[:, 0] if isinstance(tmp, pd.DataFrame) else tmp
+            return df[name] if name in df.columns else None
+
+        close = _field("Close")
+        if close is None:
+            close = _field("Adj Close")
+        if close is None:
+            close = df.iloc[:, 0]
+        high, low = _field("High"), _field("Low")
+        hlc3 = (high + low + close) / 3.0 if (high is not None and low is not None) else close
+
+        # --- Clean and align to a complete daily index ---
+        px = pd.DataFrame({"close": close, "hlc3": hlc3}, dtype=np.float64)   # yfinance prices are float64
+        px.index = pd.to_datetime(px.index).normalize()
+        all_days = pd.date_range(px.index.min(), px.index.max(), freq="D")
+        px = px.reindex(all_days).ffill()
+        _write_cache(BTC_CACHE_FILE, px, cached)
+        return px
+
+    except Exception as e:
+        print(f"[WARN] BTC price fetch failed: {e}\n{traceback.format_exc()}")
+        return pd.DataFrame({"close": [], "hlc3": []}, index=pd.DatetimeIndex([]), dtype=float)
+
 def btc_outflow_series(
     start: pd.Timestamp,
     end: pd.Timestamp,
@@ -363,63 +536,40 @@ def btc_outflow_series(
     fallback_per_day_mm_override: float | None = None,
     fee_bps: float = BTC_FEE_BPS,
     price_basis: str = BTC_PRICE_BASIS,
+    btc_prices: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """
-    DAILY cash outflow for BTC buys in [start, end]. Tries Yahoo prices; if that fails,
+    DAILY cash outflow for BTC buys in [start, end]. Prices come from `btc_prices`
+    (output of `fetch_btc_prices`) or are downloaded from Yahoo; if none are available,
     falls back to spreading a fixed USD total (BTC_USD_TOTAL_MM) evenly across days.
     """
     dates = pd.date_range(start, end, freq="D")
     if len(dates) == 0:
         return pd.DataFrame(index=pd.DatetimeIndex([], name="date"), columns=["cash_flow"]).fillna(0.0)
     try:
-        btc = yf.download(
-            "BTC-USD",
-            start=(start - pd.Timedelta(days=3)).date(),
-            end=(end + pd.Timedelta(days=3)).date(),
-            progress=False,
-            auto_adjust=False,
-        )
-        if btc.empty:
-            raise RuntimeError("Empty Yahoo response")
+        if btc_prices is None:
+            btc_prices = fetch_btc_prices(start - pd.Timedelta(days=3), end + pd.Timedelta(days=3))
         # --- choose price basis: "close" (default) or "hlc3" (avg High/Low/Close) ---
         basis = (price_basis or "close").lower()
-        if basis == "hlc3" and all(k in btc.columns for k in ["High","Low","Close"]):
-            px = (btc["High"] + btc["Low"] + btc["Close"]) / 3.0
-        else:
-            # robust close extraction fallback
-            if "Close" in btc.columns:
-                px = btc["Close"]
-            else:
-                if isinstance(btc.columns, pd.MultiIndex):
-                    if ("Close", "BTC-USD") in btc.columns:
-                        px = btc[("Close","BTC-USD")]
-                    elif "Adj Close" in btc.columns.get_level_values(0):
-                        tmp = btc.xs("Adj Close", axis=1, level=0)
-                        px = tmp.iloc[:,0] if isinstance(tmp, pd.DataFrame) else tmp
-                    else:
-                        px = btc.iloc[:,0]
-                else:
-                    px = btc["Adj Close"] if "Adj Close" in btc.columns else btc.squeeze("columns")
-
-        if isinstance(px, pd.DataFrame) and px.shape[1] == 1:
-            px = px.iloc[:, 0]
-        px = pd.to_numeric(px, errors="coerce").reindex(dates).ffill()
+        px = (btc_prices["hlc3" if basis == "hlc3" else "close"]
+              .reindex(dates).ffill().to_numpy(dtype=np.float64))
+        if np.isnan(px).all():
+            raise RuntimeError("no BTC-USD prices in purchase window")
         units_per_day = (
             float(units_per_day_override) if units_per_day_override is not None
             else float(total_btc) / len(dates)
         )
         fee_mult = 1.0 + (float(fee_bps) / 10_000.0)
-        usd_outflow = px.to_numpy() * units_per_day * fee_mult
-        outflow_mm = -(usd_outflow / 1_000_000.0).astype(float)
+        outflow_mm = px * (-units_per_day * fee_mult / 1_000_000.0)
         # also return units and price for diagnostics
         return pd.DataFrame({
             "cash_flow": outflow_mm,             # USD millions (negative)
             "btc_units": np.full(len(dates), units_per_day, dtype=float),
-            "btc_price_usd": px.to_numpy().astype(float),
+            "btc_price_usd": px,
             "btc_fee_mult": np.full(len(dates), fee_mult, dtype=float),
         }, index=dates)
     except Exception as e:
-        print(f"[WARN] BTC price fetch failed: {e}\n{traceback.format_exc()}")
+        print(f"[WARN] BTC outflow pricing failed: {e}\n{traceback.format_exc()}")
         fee_mult = 1.0 + (float(fee_bps) / 10_000.0)
         per_day_mm = -((fallback_per_day_mm_override if fallback_per_day_mm_override is not None
                         else (BTC_USD_TOTAL_MM / len(dates))) * fee_mult)
@@ -430,73 +580,96 @@ def btc_outflow_series(
             "btc_price_usd": np.full(len(dates), np.nan),
             "btc_fee_mult": np.full(len(dates), fee_mult, dtype=float),
         }, index=dates)
-def prefetch_btc_closes(q_end_dates: List[pd.Timestamp]) -> pd.Series:
+
+def prefetch_btc_closes(q_end_dates: List[pd.Timestamp],
+                        btc_prices: pd.DataFrame | None = None) -> pd.Series:
     """
-    Fetch BTC-USD closes for all quarter-end dates in one call, robustly.
+    BTC-USD closes for all quarter-end dates, from `btc_prices` (output of
+    `fetch_btc_prices`) or a single download.
     Returns a Series indexed by normalized q_end (Timestamp) with a USD close.
-    Falls back to NaNs if download fails.
+    Falls back to NaNs if no prices are available.
     """
     if len(q_end_dates) == 0:
         return pd.Series(dtype=float)
 
-    start = (min(q_end_dates) - pd.Timedelta(days=5)).date()
-    end   = (max(q_end_dates) + pd.Timedelta(days=2)).date()  # yfinance 'end' is exclusive
-
-    try:
-        df = yf.download("BTC-USD", start=start, end=end, progress=False, auto_adjust=False)
-        if df is None or df.empty:
-            raise RuntimeError("empty BTC-USD frame")
-
-        # --- Normalize whatever yfinance returned into a 1-D Series ---
-        if isinstance(df.columns, pd.MultiIndex):
-            px = None
-            if ("Close", "BTC-USD") in df.columns:
-                px = df[("Close", "BTC-USD")]
-            elif "Close" in df.columns.get_level_values(0):
-                tmp = df.xs("Close", axis=1, level=0)
-                px = tmp.iloc[:, 0] if isinstance(tmp, pd.DataFrame) else tmp
-            elif "Adj Close" in df.columns.get_level_values(0):
-                tmp = df.xs("Adj Close", axis=1, level=0)
-                px = tmp.iloc[:, 0] if isinstance(tmp, pd.DataFrame) else tmp
-            else:
-                px = df.iloc[:, 0]
-        else:
-            if "Close" in df.columns:
-                px = df["Close"]
-            elif "Adj Close" in df.columns:
-                px = df["Adj Close"]
-            else:
-                px = df.squeeze("columns")
-
-        # If still a DataFrame, squeeze to first column; if ndarray, wrap as Series
-        if isinstance(px, pd.DataFrame):
-            px = px.iloc[:, 0]
-        if not isinstance(px, pd.Series):
-            px = pd.Series(np.asarray(px).reshape(-1), index=pd.to_datetime(df.index).normalize())
-
-        # --- Clean, align, and map to quarter ends ---
-        px = pd.to_numeric(px, errors="coerce")
-        px.index = pd.to_datetime(px.index).normalize()
-
-        all_days = pd.date_range(px.index.min(), px.index.max(), freq="D")
-        px = px.reindex(all_days).ffill()
-
-        want = pd.to_datetime(pd.Index(q_end_dates)).normalize()
-        out = px.reindex(want, method="ffill")
-        out.index = want
-        return out.astype(float)
-
-    except Exception as e:
-        print(f"[WARN] BTC prefetch failed: {e}\n{traceback.format_exc()}")
-        want = pd.to_datetime(pd.Index(q_end_dates)).normalize()
+    want = pd.to_datetime(pd.Index(q_end_dates)).normalize()
+    if btc_prices is None:
+        btc_prices = fetch_btc_prices(min(q_end_dates) - pd.Timedelta(days=5),
+                                      max(q_end_dates) + pd.Timedelta(days=2))
+    if btc_prices.empty:
         return pd.Series(index=want, data=np.nan, dtype=float)
 
+    out = btc_prices["close"].reindex(want, method="ffill")
+    out.index = want
+    return out.astype(float)
+
 # -----------------------------
 # Simulation
 # -----------------------------
 
 
 
+# Per-quarter result columns (output order) and their dtypes
+RESULT_COLUMNS: Dict[str, str] = {
+    "q_end": "datetime64[ns]",
+    "is_forecast": "bool",
+    "days": "int64",
+    "modeled_interest_mm": "float64",
+    "reported_interest_mm": "float64",
+    "abs_error_mm": "float64",
+    "pct_error": "float64",
+    "start_liq_mm": "float64",
+    "end_liq_mm": "float64",
+    "events_mm": "float64",
+    "btc_units_window": "float64",
+    # BTC diagnostics
+    "btc_spent_mm": "float64",
+    "btc_units_executed": "float64",
+    "btc_avg_price_usd": "float64",
+    "btc_px_qbeg_usd": "float64",
+    "btc_px_qend_usd": "float64",
+    "btc_units_holdings": "float64",
+    "btc_fair_value_mm": "float64",
+    "btc_earnings_mm": "float64",
+    "end_liq_carry_mm": "float64",
+    "total_end_liq_mm": "float64",
+    # Yield & drift diagnostics
+    "avg_balance_mm": "float64",
+    "implied_ann_yield_modeled_pct": "float64",
+    "implied_ann_yield_reported_pct": "float64",
+    "ref_3m_ann_yield_pct": "float64",
+    "modeled_minus_3m_bps": "Int64",
+    "reported_minus_3m_bps": "Int64",
+    "drift_per_day_mm": "float64",
+    "total_drift_mm": "float64",
+}
+
+# Decimal places applied to the results frame in one pass after the loop
+ROUND_SPEC: Dict[str, int] = {
+    "modeled_interest_mm": 2,
+    "abs_error_mm": 2,
+    "pct_error": 4,
+    "start_liq_mm": 2,
+    "end_liq_mm": 2,
+    "events_mm": 2,
+    "btc_spent_mm": 2,
+    "btc_units_executed": 6,
+    "btc_avg_price_usd": 2,
+    "btc_px_qbeg_usd": 2,
+    "btc_px_qend_usd": 2,
+    "btc_units_holdings": 6,
+    "btc_fair_value_mm": 2,
+    "btc_earnings_mm": 2,
+    "end_liq_carry_mm": 2,
+    "total_end_liq_mm": 2,
+    "avg_balance_mm": 2,
+    "implied_ann_yield_modeled_pct": 2,
+    "implied_ann_yield_reported_pct": 2,
+    "ref_3m_ann_yield_pct": 2,
+    "drift_per_day_mm": 6,
+    "total_drift_mm": 2,
+}
+
 @dataclass
 class QuarterInputs:
     q_start: pd.Timestamp
@@ -506,57 +679,196 @@ class QuarterInputs:
     events: pd.DataFrame  # rows within quarter (date, amount, label)
     btc_out: pd.DataFrame # 'cash_flow' daily (USD mm negative); may be empty
 
-def build_daily_path(inputs: QuarterInputs, rates: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
+def build_daily_path(inputs: QuarterInputs, daily_rate: np.ndarray) -> Tuple[pd.DataFrame, float]:
     """
     Construct daily balance path that:
       - Starts at start_liq
       - Applies dated events and BTC purchase outflows on exact days
       - Adds a linear "residual drift" so that terminal equals end_liq
-    Then accrues daily interest using 'rates' (joined by date).
+    Then accrues daily interest using `daily_rate` (one entry per day, q_start..q_end).
     Returns (daily_df, interest_mm) where interest_mm is in USD millions.
     """
     days = pd.date_range(inputs.q_start, inputs.q_end, freq="D")
     df = pd.DataFrame(index=days)
     df.index.name = "date"
+    n_days = len(df)
 
-    # Events (point flows) and BTC (daily)
-    e = inputs.events.set_index("date")["amount"] if not inputs.events.empty else pd.Series(dtype=float)
-    df["events"] = e.reindex(df.index, fill_value=0.0).astype(float)
-    df["btc"] = (inputs.btc_out.reindex(df.index)["cash_flow"].fillna(0.0)
-                 if not inputs.btc_out.empty else 0.0)
+    def _day_offsets(dates) -> Tuple[np.ndarray, np.ndarray]:
+        off = day_offsets(dates, inputs.q_start)
+        return off, (off >= 0) & (off < n_days)
+
+    # Events (point flows) and BTC (daily), scattered onto day offsets within the quarter
+    # (empty frames may come without columns, e.g. pd.DataFrame(), so they are skipped)
+    events_arr = np.zeros(n_days)
+    if not inputs.events.empty:
+        off, inside = _day_offsets(inputs.events["date"].to_numpy())
+        np.add.at(events_arr, off[inside], inputs.events["amount"].to_numpy(dtype=float)[inside])
+    btc_arr = np.zeros(n_days)
+    if not inputs.btc_out.empty:
+        off, inside = _day_offsets(inputs.btc_out.index.to_numpy())
+        btc_arr[off[inside]] = inputs.btc_out["cash_flow"].fillna(0.0).to_numpy(dtype=float)[inside]
+    df["events"] = events_arr
+    df["btc"] = btc_arr
 
     # Residual drift per day to reconcile to end_liq
-    mech_flows_total = (df["events"] + df["btc"]).sum()
-    n_days = len(df)
+    mech_flows_total = events_arr.sum() + btc_arr.sum()
     drift_per_day = (inputs.end_liq - inputs.start_liq - mech_flows_total) / n_days
     df["drift"] = drift_per_day
 
-    # Daily ending balance
-    balance = []
-    bal = inputs.start_liq
-    for d in df.itertuples():
-        bal += d.events + d.btc + d.drift
-        balance.append(bal)
+    # Daily ending balance = start_liq + running sum of the day's flows
+    flows = events_arr + btc_arr + drift_per_day
+    balance = inputs.start_liq + np.cumsum(flows)
     df["ending_balance_mm"] = balance
 
     # Rates & interest (rates are already dense & non-NaN from fetch_rates)
-    df = df.join(rates.reindex(df.index)[["daily_rate"]])
-    df["interest_mm"] = df["ending_balance_mm"] * df["daily_rate"]
+    df["daily_rate"] = daily_rate
+    df["interest_mm"] = balance * daily_rate
+
+    return df, float(np.dot(balance, daily_rate))
+
 
-    return df, float(df["interest_mm"].sum())
+@dataclass
+class QuarterTerms:
+    days: np.ndarray           # calendar days per quarter
+    flow_sum: np.ndarray       # Σ mechanical flows (events + BTC), USD mm
+    flow_mean: np.ndarray      # mean running sum of flows, USD mm
+    rate_sum: np.ndarray       # Σ daily_rate
+    flow_rate_dot: np.ndarray  # Σ running_flows[k] * daily_rate[k]
+    ramp_rate_dot: np.ndarray  # Σ (k+1) * daily_rate[k]
+
+def _accrual_terms(flows, daily_rate, seg_starts):
+    """
+    Single pass over the daily grid accumulating every per-quarter term at once.
+    Quarters are independent here (the carry is applied afterwards), so the outer
+    loop can run across threads in the parallel build.
+    """
+    n_q = seg_starts.shape[0]
+    n_total = flows.shape[0]
+    days = np.empty(n_q, dtype=np.int64)
+    flow_sum = np.empty(n_q)
+    flow_mean = np.empty(n_q)
+    rate_sum = np.empty(n_q)
+    flow_rate_dot = np.empty(n_q)
+    ramp_rate_dot = np.empty(n_q)
+    for q in prange(n_q):
+        lo = seg_starts[q]
+        hi = seg_starts[q + 1] if q + 1 < n_q else n_total
+        running = 0.0        # running sum of flows, restarted each quarter
+        s_running = 0.0
+        s_rate = 0.0
+        s_flow_rate = 0.0
+        s_ramp_rate = 0.0
+        for i in range(lo, hi):
+            r = daily_rate[i]
+            running += flows[i]
+            s_running += running
+            s_rate += r
+            s_flow_rate += running * r
+            s_ramp_rate += (i - lo + 1) * r
+        days[q] = hi - lo
+        flow_sum[q] = running
+        flow_mean[q] = s_running / (hi - lo)
+        rate_sum[q] = s_rate
+        flow_rate_dot[q] = s_flow_rate
+        ramp_rate_dot[q] = s_ramp_rate
+    return days, flow_sum, flow_mean, rate_sum, flow_rate_dot, ramp_rate_dot
+
+# Serial and threaded builds of the same kernel; PARALLEL_ACCRUAL picks one per call.
+# The threaded build compiles on first use and skips numba's on-disk cache, which is
+# keyed by the Python function and would otherwise be shared by both builds.
+_accrual_terms_kernel = njit(cache=True)(_accrual_terms)
+_accrual_terms_parallel = njit(parallel=True)(_accrual_terms)
+
+def quarter_accrual_terms(flows: np.ndarray, daily_rate: np.ndarray,
+                          seg_starts: np.ndarray) -> QuarterTerms:
+    """
+    Per-quarter accrual terms for contiguous quarters laid out on one daily grid.
+    `seg_starts` are the offsets of each quarter's first day; the last quarter runs
+    to the end of the arrays.
+
+    On day k of a quarter the balance is start_liq + running_flows[k] + drift * (k+1),
+    so interest and average balance are affine in (start_liq, drift):
+        interest    = start_liq * rate_sum + flow_rate_dot + drift * ramp_rate_dot
+        avg_balance = start_liq + flow_mean + drift * (days + 1) / 2
+    which lets every quarter be reduced in a single pass (`_accrual_terms`).
+    """
+    kernel = _accrual_terms_parallel if PARALLEL_ACCRUAL else _accrual_terms_kernel
+    return QuarterTerms(*kernel(
+        np.ascontiguousarray(flows, dtype=np.float64),
+        np.ascontiguousarray(daily_rate, dtype=np.float64),
+        np.ascontiguousarray(seg_starts, dtype=np.int64),
+    ))
+
+@dataclass
+class QuarterAccruals:
+    start_liq: np.ndarray       # USD mm, carried from the previous quarter
+    end_liq: np.ndarray         # USD mm, reported or (forecast) start + flows
+    drift_per_day: np.ndarray   # USD mm/day, 0 for forecast quarters
+    interest: np.ndarray        # modeled interest, USD mm
+    avg_balance: np.ndarray     # USD mm
+    carry: np.ndarray           # next quarter's start_liq
+
+@njit(cache=True)
+def _carry_kernel(start_liq0, reported_end, days, flow_sum, flow_mean,
+                  rate_sum, flow_rate_dot, ramp_rate_dot):
+    """
+    Sequential carry over quarters. A NaN in `reported_end` marks a forecast
+    quarter: no drift, and modeled interest is added to the carry so it compounds.
+    """
+    n_q = days.shape[0]
+    start_liq = np.empty(n_q)
+    end_liq = np.empty(n_q)
+    drift = np.empty(n_q)
+    interest = np.empty(n_q)
+    avg_balance = np.empty(n_q)
+    carry = np.empty(n_q)
+    prev = start_liq0
+    for q in range(n_q):
+        start = prev
+        if np.isnan(reported_end[q]):
+            end = start + flow_sum[q]
+            d = 0.0
+        else:
+            end = reported_end[q]
+            d = (end - start - flow_sum[q]) / days[q]
+        acc = start * rate_sum[q] + flow_rate_dot[q] + d * ramp_rate_dot[q]
+        start_liq[q] = start
+        end_liq[q] = end
+        drift[q] = d
+        interest[q] = acc
+        avg_balance[q] = start + flow_mean[q] + d * (days[q] + 1) / 2.0
+        carry[q] = end + acc if np.isnan(reported_end[q]) else end
+        prev = carry[q]
+    return start_liq, end_liq, drift, interest, avg_balance, carry
+
+def carry_quarters(terms: QuarterTerms, reported_end: np.ndarray) -> QuarterAccruals:
+    """
+    Evaluate the affine accrual terms quarter by quarter, threading start liquidity
+    through the carry rules. The first quarter starts from its own reported end
+    liquidity (0 if it has none).
+    """
+    reported_end = np.ascontiguousarray(reported_end, dtype=np.float64)
+    start_liq0 = float(reported_end[0]) if len(reported_end) and not np.isnan(reported_end[0]) else 0.0
+    return QuarterAccruals(*_carry_kernel(
+        start_liq0, reported_end, terms.days, terms.flow_sum, terms.flow_mean,
+        terms.rate_sum, terms.flow_rate_dot, terms.ramp_rate_dot,
+    ))
 
 
 def simulate_all(net_to_gross: float = ATM_NET_TO_GROSS,
                  btc_units: float = 4710.0,
                  btc_window: Tuple[str, str] = ("2025-05-04", "2025-06-10"),
                  save_daily: bool = MAKE_DAILY_PARQUETS,
-                 forecast_quarters: int = 1) -> pd.DataFrame:
+                 forecast_quarters: int = 1,
+                 quiet: bool = False) -> pd.DataFrame:
     """
     Backtest all reported quarters and **forecast exactly one quarter ahead**.
+    `quiet=True` skips the pretty-printed yield tables (e.g. for batch exports).
     """
     qdf = build_quarter_frame_with_forecast(forecast_quarters=forecast_quarters)
-    q_liq = quarter_end_liquidity()
-    q_rep = reported_interest_income()
+    # Anchors keyed by normalized q_end Timestamp (same keys as the quarter frame)
+    q_liq = {to_dt(k): v for k, v in quarter_end_liquidity().items()}
+    q_rep = {to_dt(k): v for k, v in reported_interest_income().items()}
     events = dated_events(net_to_gross=net_to_gross)
 
     # Rates covering the whole span, incl. the appended forecast quarter
@@ -565,86 +877,117 @@ def simulate_all(net_to_gross: float = ATM_NET_TO_GROSS,
     rates = fetch_rates(start_all, end_all)
     rates = apply_future_rate_events(rates, FUTURE_RATE_EVENTS)
 
-    results = []
-    prev_end_liq = None
+    # Per-quarter outputs, one preallocated typed array per column
+    out_cols = {name: np.full(len(qdf), np.nan) if dtype in ("float64", "Int64") else np.empty(len(qdf), dtype=dtype)
+                for name, dtype in RESULT_COLUMNS.items()}
+    out_cols["q_end"][:] = qdf["q_end"].to_numpy()  # quarter ends are normalized by construction
     # ---- Track BTC position across quarters ----
     cum_btc_units = 0.0       # units held at the end of the prior quarter
     cum_btc_cost_mm = 0.0     # cumulative USD cost basis (millions)
     prev_q_end = None         # previous quarter-end Timestamp (for qtr P&L)
 
-    # Prefetch BTC closes for every q_end to avoid per-row downloads
-    btc_closes_by_qend = prefetch_btc_closes(qdf["q_end"].tolist())
-
     # Global BTC purchase schedule (constant units/day across the full window)
     btc_window_start = pd.to_datetime(btc_window[0])
     btc_window_end   = pd.to_datetime(btc_window[1])
+
+    # One BTC-USD download covers every q_end valuation and the purchase window
+    btc_prices = fetch_btc_prices(
+        min(qdf["q_end"].min() - pd.Timedelta(days=5), btc_window_start - pd.Timedelta(days=3)),
+        max(qdf["q_end"].max() + pd.Timedelta(days=2), btc_window_end + pd.Timedelta(days=3)),
+    )
+    btc_closes_by_qend = prefetch_btc_closes(qdf["q_end"].tolist(), btc_prices=btc_prices)
     btc_global_days = pd.date_range(btc_window_start, btc_window_end, freq="D")
     units_per_day_global = (btc_units / len(btc_global_days)) if len(btc_global_days) else 0.0
     fallback_per_day_mm_global = (BTC_USD_TOTAL_MM / len(btc_global_days)) if len(btc_global_days) else 0.0
 
-
-
-    for _, row in qdf.iterrows():
-        q_end = row["q_end"]
-        q_start = row["q_start"]
-        end_key = q_end.strftime("%Y-%m-%d")
-
-        # Start liquidity = previous quarter end liquidity
-        if prev_end_liq is None:
-            reported_end = q_liq.get(end_key, np.nan)
-            start_liq = float(reported_end) if not np.isnan(reported_end) else 0.0
-        else:
-            start_liq = float(prev_end_liq)
-
-        # Quarter’s dated events & BTC window overlap
-        ev_q = events[(events["date"] >= q_start) & (events["date"] <= q_end)].copy()
-        btc_start, btc_end = pd.to_datetime(btc_window[0]), pd.to_datetime(btc_window[1])
-        overlap_start = max(q_start, btc_start)
-        overlap_end = min(q_end, btc_end)
-        if overlap_start <= overlap_end:
-            btc_df = btc_outflow_series(
-                overlap_start, overlap_end,
-                total_btc=btc_units,
-                units_per_day_override=units_per_day_global,
-                fallback_per_day_mm_override=fallback_per_day_mm_global,
-                fee_bps=BTC_FEE_BPS,
-                price_basis=BTC_PRICE_BASIS,
-            )
-        else:
-            btc_df = pd.DataFrame(index=pd.DatetimeIndex([], name="date"), columns=["cash_flow"])
+    # ---- Daily grid: quarters are contiguous, so lay every flow out on one array ----
+    # Grid positions are int64 day offsets from span_start.
+    span_start, span_end = qdf["q_start"].iloc[0], qdf["q_end"].iloc[-1]
+    n_grid = int(day_offsets(span_end, span_start)) + 1
+    seg_starts = day_offsets(qdf["q_start"], span_start)
+
+    # dated_events() is sorted by date, so quarter slices are searchsorted bounds
+    ev_day = day_offsets(events["date"], span_start)
+    ev_amount = events["amount"].to_numpy(dtype=float)
+    events_by_day = np.zeros(n_grid)
+    in_span = slice(np.searchsorted(ev_day, 0, side="left"), np.searchsorted(ev_day, n_grid - 1, side="right"))
+    np.add.at(events_by_day, ev_day[in_span], ev_amount[in_span])
+    out_cols["events_mm"][:] = np.add.reduceat(events_by_day, seg_starts)  # dated events per quarter
+    flows = events_by_day.copy()
+    ev_bounds = np.searchsorted(ev_day, np.append(seg_starts, n_grid), side="left")  # quarter iq: [iq, iq+1)
+
+    # BTC purchases for the whole window in one call, scattered onto the grid
+    btc_cash = np.zeros(n_grid)           # USD mm (negative) per day
+    btc_units_by_day = np.zeros(n_grid)   # units bought per day (NaN if unpriced)
+    btc_all_start = max(span_start, btc_window_start)
+    btc_all_end = min(span_end, btc_window_end)
+    if btc_all_start <= btc_all_end:
+        btc_all = btc_outflow_series(
+            btc_all_start, btc_all_end,
+            total_btc=btc_units,
+            units_per_day_override=units_per_day_global,
+            fallback_per_day_mm_override=fallback_per_day_mm_global,
+            fee_bps=BTC_FEE_BPS,
+            price_basis=BTC_PRICE_BASIS,
+            btc_prices=btc_prices,
+        )
+        pos = day_offsets(btc_all.index, span_start)
+        btc_cash[pos] = np.nan_to_num(btc_all["cash_flow"].to_numpy())
+        btc_units_by_day[pos] = btc_all["btc_units"].to_numpy()
+        flows += btc_cash
+
+    # Rates are dense over start_all..end_all: address them by integer day offset
+    rates_base = rates.index[0]
+    daily_rate_all = rates["daily_rate"].to_numpy()
+    rate_pct_all = rates["rate_pct"].to_numpy()
+    span_off = int(day_offsets(span_start, rates_base))
+    daily_rate = daily_rate_all[span_off:span_off + n_grid]
+    terms = quarter_accrual_terms(flows, daily_rate, seg_starts)
+    # Reported end liquidity per quarter (NaN → forecast), then the carried liquidity path
+    reported_end_all = np.array([q_liq.get(q, np.nan) for q in qdf["q_end"]], dtype=float)
+    acc = carry_quarters(terms, reported_end_all)
+
+    for iq, row in enumerate(qdf.itertuples(index=False)):
+        q_end = row.q_end
+        q_start = row.q_start
+        days_in_q = int(terms.days[iq])
+        q_days = slice(int(seg_starts[iq]), int(seg_starts[iq]) + days_in_q)  # on the grid
+        q_rates = slice(span_off + q_days.start, span_off + q_days.stop)      # in the rate arrays
+
+        # Liquidity path & accrual from the carried terms (see `carry_quarters`)
+        start_liq = float(acc.start_liq[iq])
+        end_liq = float(acc.end_liq[iq])
+        is_forecast = bool(np.isnan(reported_end_all[iq]))
+        drift_per_day_mm = float(acc.drift_per_day[iq])
+        modeled_interest_mm = float(acc.interest[iq])
+        avg_balance_mm = float(acc.avg_balance[iq])
+
+        # Quarter’s BTC window overlap
+        overlap_start = max(q_start, btc_window_start)
+        overlap_end = min(q_end, btc_window_end)
 
         # ---- BTC diagnostics (compute once, reuse) ----
-        btc_spent_mm = float(-btc_df["cash_flow"].sum()) if not btc_df.empty else 0.0  # +USD mm
-        if not btc_df.empty and "btc_units" in btc_df:
-            btc_units_executed = float(pd.to_numeric(btc_df["btc_units"], errors="coerce").sum())
-        else:
-            btc_units_executed = 0.0
+        btc_spent_mm = float(-btc_cash[q_days].sum()) + 0.0  # +USD mm; "+ 0.0" turns -0.0 (no buys) into 0.0
+        btc_units_executed = float(np.nansum(btc_units_by_day[q_days]))
         btc_avg_price_usd = (btc_spent_mm * 1_000_000.0 / btc_units_executed) if btc_units_executed > 0 else np.nan
 
 
-        # Determine end_liq and forecast flag
-        reported_end = q_liq.get(end_key, np.nan)
-        is_forecast = False
-        if np.isnan(reported_end):
-            is_forecast = True
-            ev_sum = float(ev_q["amount"].sum()) if not ev_q.empty else 0.0
-            btc_sum = float(btc_df["cash_flow"].sum()) if not btc_df.empty else 0.0
-            end_liq = float(start_liq + ev_sum + btc_sum)  # drift=0 by construction
-        else:
-            end_liq = float(reported_end)
-
-        q_inputs = QuarterInputs(
-            q_start=q_start, q_end=q_end,
-            start_liq=start_liq, end_liq=end_liq,
-            events=ev_q, btc_out=btc_df
-        )
-
-        daily, modeled_interest_mm = build_daily_path(q_inputs, rates)
         if save_daily:
-            OUT_DIR.mkdir(parents=True, exist_ok=True)
-            daily.to_parquet(str(OUT_DIR / f"gme_quarter_{q_end.date()}_daily.parquet"))
-
-        reported = q_rep.get(end_key)
+            q_inputs = QuarterInputs(
+                q_start=q_start, q_end=q_end,
+                start_liq=start_liq, end_liq=end_liq,
+                events=events.iloc[ev_bounds[iq]:ev_bounds[iq + 1]],
+                btc_out=pd.DataFrame({"cash_flow": btc_cash[q_days]},
+                                     index=pd.date_range(q_start, periods=days_in_q, freq="D")),
+            )
+            daily, _ = build_daily_path(q_inputs, daily_rate_all[q_rates])
+            _ensure_dir(OUT_DIR)
+            # zstd + dictionary/RLE: drift and daily_rate are (piecewise) constant per quarter
+            daily.to_parquet(str(OUT_DIR / f"gme_quarter_{q_end.date()}_daily.parquet"),
+                             engine="pyarrow", compression="zstd", compression_level=7,
+                             row_group_size=len(daily), use_dictionary=True)
+
+        reported = q_rep.get(q_end)
         abs_err = np.nan
         pct_err = np.nan
         if reported is not None:
@@ -652,14 +995,11 @@ def simulate_all(net_to_gross: float = ATM_NET_TO_GROSS,
             pct_err = abs_err / reported if reported != 0 else np.nan
 
         # ---- Drift diagnostics ----
-        drift_per_day_mm = float(daily["drift"].iloc[0]) if not daily.empty else np.nan
-        total_drift_mm = float(daily["drift"].sum()) if not daily.empty else np.nan
- 
+        total_drift_mm = drift_per_day_mm * days_in_q
+
         # ---- Yield diagnostics: average balance and implied annualized yields ----
-        days_in_q = len(daily)
-        avg_balance_mm = float(daily["ending_balance_mm"].mean())
         # quarter-average 3M T-bill annual yield (%), from fetched FRED series
-        ref_3m_ann_yield_pct = float(rates.loc[q_start:q_end, "rate_pct"].mean())
+        ref_3m_ann_yield_pct = float(rate_pct_all[q_rates].mean())
         # implied annualized yields (%)
         implied_ann_yield_modeled_pct = (
             (modeled_interest_mm / (avg_balance_mm * days_in_q)) * 365.0 * 100.0
@@ -670,15 +1010,6 @@ def simulate_all(net_to_gross: float = ATM_NET_TO_GROSS,
             if (reported is not None and not np.isnan(reported) and avg_balance_mm > 0 and days_in_q > 0)
             else np.nan
         )
-        # spreads vs 3M (basis points)
-        modeled_minus_3m_bps = (
-            round((implied_ann_yield_modeled_pct - ref_3m_ann_yield_pct) * 100.0)
-            if not np.isnan(implied_ann_yield_modeled_pct) else np.nan
-        )
-        reported_minus_3m_bps = (
-            round((implied_ann_yield_reported_pct - ref_3m_ann_yield_pct) * 100.0)
-            if not np.isnan(implied_ann_yield_reported_pct) else np.nan
-        )
 
 
         # ---- Quarterly BTC holdings, valuation & P&L (single source of truth) ----
@@ -703,103 +1034,103 @@ def simulate_all(net_to_gross: float = ATM_NET_TO_GROSS,
         # Liquidity & carry rules:
         # - For reported quarters: reported end_liq already embeds interest → carry = end_liq
         # - For forecast quarters: add modeled interest so it compounds → carry = end_liq + modeled_interest_mm
-        end_liq_carry_mm = float(end_liq) + (modeled_interest_mm if is_forecast else 0.0)
+        end_liq_carry_mm = float(acc.carry[iq])
         # Total liquidity view (cash+securities + BTC FV); for forecasts this also includes modeled interest
         total_end_liq_mm = end_liq_carry_mm + fv_end_mm
 
-        results.append({
-            "q_end": pd.Timestamp(q_end).normalize(),
-            "is_forecast": is_forecast,
-            "days": len(daily),
-            "modeled_interest_mm": round(float(modeled_interest_mm), 2),
-            "reported_interest_mm": reported,
-            "abs_error_mm": round(float(abs_err), 2) if not math.isnan(abs_err) else np.nan,
-            "pct_error": round(float(pct_err), 4) if not math.isnan(pct_err) else np.nan,
-            "start_liq_mm": round(float(start_liq), 2),
-            "end_liq_mm": round(float(end_liq), 2),
-            "events_mm": round(float(ev_q["amount"].sum()), 2) if not ev_q.empty else 0.0,
-            "btc_units_window": (btc_units if (overlap_start <= overlap_end) else 0.0),
-            # BTC diagnostics
-            "btc_spent_mm": round(btc_spent_mm, 2),
-            "btc_units_executed": round(btc_units_executed, 6),
-            "btc_avg_price_usd": round(btc_avg_price_usd, 2) if np.isfinite(btc_avg_price_usd) else np.nan,
-            "btc_px_qbeg_usd": round(btc_px_qbeg_usd, 2) if np.isfinite(btc_px_qbeg_usd) else np.nan,
-            "btc_px_qend_usd": round(btc_px_qend_usd, 2) if np.isfinite(btc_px_qend_usd) else np.nan,
-            "btc_units_holdings": round(btc_units_end, 6),
-            "btc_fair_value_mm": round(fv_end_mm, 2),
-            "btc_earnings_mm": round(btc_earnings_mm, 2),
-            "end_liq_carry_mm": round(end_liq_carry_mm, 2),
-            "total_end_liq_mm": round(total_end_liq_mm, 2),
-            # New diagnostics
-            "avg_balance_mm": round(avg_balance_mm, 2),
-            "implied_ann_yield_modeled_pct": round(implied_ann_yield_modeled_pct, 2) if not np.isnan(implied_ann_yield_modeled_pct) else np.nan,
-            "implied_ann_yield_reported_pct": round(implied_ann_yield_reported_pct, 2) if not np.isnan(implied_ann_yield_reported_pct) else np.nan,
-            "ref_3m_ann_yield_pct": round(ref_3m_ann_yield_pct, 2) if not np.isnan(ref_3m_ann_yield_pct) else np.nan,
-            "modeled_minus_3m_bps": modeled_minus_3m_bps,
-            "reported_minus_3m_bps": reported_minus_3m_bps,
-            "drift_per_day_mm": round(drift_per_day_mm, 6) if not math.isnan(drift_per_day_mm) else np.nan,
-            "total_drift_mm": round(total_drift_mm, 2) if not math.isnan(total_drift_mm) else np.nan,
-
-        })
-
-        # Carry forward for next quarter start_liq (compounds interest only for forecasts)
-        prev_end_liq = end_liq_carry_mm
+        # ---- Write this quarter's row into the preallocated result columns ----
+        out_cols["is_forecast"][iq] = is_forecast
+        out_cols["days"][iq] = days_in_q
+        out_cols["modeled_interest_mm"][iq] = modeled_interest_mm
+        out_cols["reported_interest_mm"][iq] = reported if reported is not None else np.nan
+        out_cols["abs_error_mm"][iq] = abs_err
+        out_cols["pct_error"][iq] = pct_err
+        out_cols["start_liq_mm"][iq] = start_liq
+        out_cols["end_liq_mm"][iq] = end_liq
+        out_cols["btc_units_window"][iq] = (btc_units if (overlap_start <= overlap_end) else 0.0)
+        # BTC diagnostics
+        out_cols["btc_spent_mm"][iq] = btc_spent_mm
+        out_cols["btc_units_executed"][iq] = btc_units_executed
+        out_cols["btc_avg_price_usd"][iq] = btc_avg_price_usd
+        out_cols["btc_px_qbeg_usd"][iq] = btc_px_qbeg_usd
+        out_cols["btc_px_qend_usd"][iq] = btc_px_qend_usd
+        out_cols["btc_units_holdings"][iq] = btc_units_end
+        out_cols["btc_fair_value_mm"][iq] = fv_end_mm
+        out_cols["btc_earnings_mm"][iq] = btc_earnings_mm
+        out_cols["end_liq_carry_mm"][iq] = end_liq_carry_mm
+        out_cols["total_end_liq_mm"][iq] = total_end_liq_mm
+        # New diagnostics
+        out_cols["avg_balance_mm"][iq] = avg_balance_mm
+        out_cols["implied_ann_yield_modeled_pct"][iq] = implied_ann_yield_modeled_pct
+        out_cols["implied_ann_yield_reported_pct"][iq] = implied_ann_yield_reported_pct
+        out_cols["ref_3m_ann_yield_pct"][iq] = ref_3m_ann_yield_pct
+        out_cols["drift_per_day_mm"][iq] = drift_per_day_mm
+        out_cols["total_drift_mm"][iq] = total_drift_mm
+
         prev_q_end = q_end
 
 
-    # Build results frame
-    res = pd.DataFrame(results)
+    # Spreads vs 3M (basis points) from the unrounded yields; NaN yields stay NaN
+    out_cols["modeled_minus_3m_bps"] = np.round((out_cols["implied_ann_yield_modeled_pct"] - out_cols["ref_3m_ann_yield_pct"]) * 100.0)
+    out_cols["reported_minus_3m_bps"] = np.round((out_cols["implied_ann_yield_reported_pct"] - out_cols["ref_3m_ann_yield_pct"]) * 100.0)
 
-    # Ensure types that downstream math expects
-    res["reported_interest_mm"] = pd.to_numeric(res["reported_interest_mm"], errors="coerce")
+    # Build results frame (dtypes fixed by RESULT_COLUMNS; nullable ints keep NaN as <NA>)
+    res = pd.DataFrame({name: (pd.array(arr, dtype="Int64") if RESULT_COLUMNS[name] == "Int64" else arr)
+                        for name, arr in out_cols.items()})
+    # Round once, column-wise (metrics below are derived from the rounded values)
+    res = res.round(ROUND_SPEC)
 
-    # Normalize q_end once (keep NaT if any)
-    res["q_end"] = pd.to_datetime(res["q_end"], errors="coerce").dt.normalize()
+    mod = res["modeled_interest_mm"].to_numpy()
+    rep = res["reported_interest_mm"].to_numpy()
 
     # ------ Operating drift (non-interest plug) ------
-    res["operating_drift_mm"] = (res["total_drift_mm"] - res["modeled_interest_mm"]).round(2)
+    od = res["total_drift_mm"].to_numpy() - mod
     # Forecast rows: by design we show NaN for operating drift
-    res.loc[res["is_forecast"], "operating_drift_mm"] = np.nan
-
-    # (Backwards-compat: drop legacy forecast-only column if it exists from old runs)
-    if "total_end_liq_forecast_mm" in res.columns: res = res.drop(columns=["total_end_liq_forecast_mm"])
-
-
-    # ------ Fiscal quarter (FY ends in March) ------
-    res.insert(1, "qtr", pd.PeriodIndex(res["q_end"], freq="Q-MAR").quarter.astype("Int64"))
+    od[res["is_forecast"].to_numpy()] = np.nan
 
     # Error metrics (for backtest rows only)
-    with np.errstate(invalid="ignore", divide="ignore"):
-        res["ape"] = np.abs(res["modeled_interest_mm"] - res["reported_interest_mm"]) / np.abs(res["reported_interest_mm"])
-        res["smape"] = np.abs(res["modeled_interest_mm"] - res["reported_interest_mm"]) / (
-            (np.abs(res["modeled_interest_mm"]) + np.abs(res["reported_interest_mm"])) / 2
-        )
-    mask = res["reported_interest_mm"].abs() >= 5.0
-    mape_clean = np.nanmean(res.loc[mask, "ape"])
-    smape_all = np.nanmean(res["smape"])
+    # (lanes without a positive denominator stay NaN instead of dividing into inf/NaN)
+    num = np.abs(mod - rep)
+    abs_rep = np.abs(rep)
+    ape = np.divide(num, abs_rep, out=np.full(num.shape, np.nan), where=abs_rep > 0)
+    den_s = (np.abs(mod) + abs_rep) * 0.5
+    smape = np.divide(num, den_s, out=np.full(num.shape, np.nan), where=den_s > 0)
+
+    # Derived columns in one assign; fiscal quarter (FY ends in March) goes next to q_end
+    m = res["q_end"].dt.month.to_numpy()
+    res = res.assign(operating_drift_mm=np.round(od, 2), ape=ape, smape=smape)
+    res.insert(1, "qtr", pd.array(((m - 4) % 12) // 3 + 1, dtype="Int64"))
+
+    # both summary means in one reduction: column 0 = APE where |reported| ≥ $5m, column 1 = sMAPE
+    mape_clean, smape_all = nanmean(np.column_stack([np.where(abs_rep >= 5.0, ape, np.nan), smape]), axis=0)
     print(f"Backtest MAPE (|reported|≥$5m): {mape_clean:.2%} | sMAPE (all): {smape_all:.2%}")
 
-    # Pretty print: implied yield vs 3M for the most recent reported quarters
-    cols = ["q_end","qtr","avg_balance_mm","implied_ann_yield_reported_pct",
-            "implied_ann_yield_modeled_pct","ref_3m_ann_yield_pct",
-            "reported_minus_3m_bps","modeled_minus_3m_bps"]
-    rep_view = res[res["reported_interest_mm"].notna()][cols].tail(8)
-    if not rep_view.empty:
-        print("\nImplied annualized yield vs 3M T-bill — reported & modeled (last 8 reported quarters):")
-        print(rep_view.to_string(index=False))
-    # Forecast quarter view (if present)
-    fc_view = res[res["is_forecast"]][["q_end","qtr","avg_balance_mm",
-                "implied_ann_yield_modeled_pct","ref_3m_ann_yield_pct","modeled_minus_3m_bps"]]
-    if not fc_view.empty:
-        print("\nForecast quarter — implied annualized yield (modeled) vs 3M:")
-        print(fc_view.to_string(index=False))
+    # Pretty-printed tables (skipped with quiet=True)
+    if not quiet:
+        # Implied yield vs 3M for the most recent reported quarters
+        cols = ["q_end","qtr","avg_balance_mm","implied_ann_yield_reported_pct",
+                "implied_ann_yield_modeled_pct","ref_3m_ann_yield_pct",
+                "reported_minus_3m_bps","modeled_minus_3m_bps"]
+        rep_view = res[res["reported_interest_mm"].notna()][cols].tail(8)
+        if not rep_view.empty:
+            print("\nImplied annualized yield vs 3M T-bill — reported & modeled (last 8 reported quarters):")
+            print(rep_view.to_string(index=False))
+        # Forecast quarter view (if present)
+        fc_view = res[res["is_forecast"]][["q_end","qtr","avg_balance_mm",
+                    "implied_ann_yield_modeled_pct","ref_3m_ann_yield_pct","modeled_minus_3m_bps"]]
+        if not fc_view.empty:
+            print("\nForecast quarter — implied annualized yield (modeled) vs 3M:")
+            print(fc_view.to_string(index=False))
 
 
     # Save results
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(OUT_DIR)
     out_path = OUT_DIR / "gme_interest_backtest_results.csv"
     res.to_csv(out_path, index=False)
     print(f"Saved results to: {out_path.resolve()}")
+    if MAKE_RESULTS_PARQUET:
+        # keeps dtypes (Int64 spreads, datetimes) and skips CSV text parsing for consumers
+        res.to_parquet(out_path.with_suffix(".parquet"), engine="pyarrow", compression="zstd", index=False)
 
     return res
 
@@ -0,0 +1,93 @@
+"""Daily accrual path and the closed-form per-quarter accrual terms built from it."""
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import interestmodel as im  # noqa: E402
+
+
+def quarter_inputs(events, btc_out, start_liq=1000.0, end_liq=1090.0):
+    return im.QuarterInputs(q_start=pd.Timestamp("2024-01-01"), q_end=pd.Timestamp("2024-03-31"),
+                            start_liq=start_liq, end_liq=end_liq, events=events, btc_out=btc_out)
+
+
+class DailyPathTest(unittest.TestCase):
+    def test_empty_events_and_btc_frames(self):
+        rate = np.full(91, 0.05 / im.DAYCOUNT)
+        drift = 90.0 / 91
+        expected = float(np.dot(1000.0 + drift * np.arange(1, 92), rate))
+        shapes = {
+            "bare": (pd.DataFrame(), pd.DataFrame()),
+            "with columns": (pd.DataFrame({"date": pd.to_datetime([]), "amount": np.array([], float)}),
+                             pd.DataFrame({"cash_flow": np.array([], float)}, index=pd.DatetimeIndex([]))),
+        }
+        for name, (events, btc_out) in shapes.items():
+            with self.subTest(name):
+                daily, interest = im.build_daily_path(quarter_inputs(events, btc_out), rate)
+                self.assertAlmostEqual(interest, expected)
+                self.assertAlmostEqual(daily["ending_balance_mm"].iloc[-1], 1090.0)
+
+
+class QuarterAccrualTermsTest(unittest.TestCase):
+    """`carry_quarters(quarter_accrual_terms(...))` must match the explicit daily path."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.q_starts = pd.to_datetime(["2024-01-01", "2024-04-01", "2024-07-01"])
+        self.days = pd.date_range("2024-01-01", "2024-09-30", freq="D")
+        n = len(self.days)
+        self.seg_starts = im.day_offsets(self.q_starts, self.days[0])
+        self.events = np.zeros(n)
+        self.events[[10, 40, 120, 200, 250]] = [500.0, -75.0, 1200.0, 300.0, -40.0]
+        self.btc = np.zeros(n)
+        self.btc[125:160] = -rng.uniform(5.0, 15.0, 35)
+        self.rate = (4.0 + rng.normal(0.0, 0.2, n)) / 100.0 / im.DAYCOUNT
+        # two reported quarters, then a forecast quarter (NaN end liquidity)
+        self.reported_end = np.array([1800.0, 2950.0, np.nan])
+
+    def terms(self):
+        return im.quarter_accrual_terms(self.events + self.btc, self.rate, self.seg_starts)
+
+    def test_matches_build_daily_path(self):
+        acc = im.carry_quarters(self.terms(), self.reported_end)
+        self.assertEqual(acc.start_liq[0], self.reported_end[0])
+        bounds = list(self.seg_starts) + [len(self.days)]
+        for q in range(len(self.q_starts)):
+            with self.subTest(quarter=q):
+                lo, hi = bounds[q], bounds[q + 1]
+                q_days = self.days[lo:hi]
+                has_event = self.events[lo:hi] != 0
+                inputs = im.QuarterInputs(
+                    q_start=q_days[0], q_end=q_days[-1],
+                    start_liq=float(acc.start_liq[q]), end_liq=float(acc.end_liq[q]),
+                    events=pd.DataFrame({"date": q_days[has_event], "amount": self.events[lo:hi][has_event]}),
+                    btc_out=pd.DataFrame({"cash_flow": self.btc[lo:hi]}, index=q_days),
+                )
+                daily, interest = im.build_daily_path(inputs, self.rate[lo:hi])
+                self.assertAlmostEqual(acc.interest[q], interest, places=9)
+                self.assertAlmostEqual(acc.avg_balance[q], daily["ending_balance_mm"].mean(), places=9)
+                self.assertAlmostEqual(acc.end_liq[q], daily["ending_balance_mm"].iloc[-1], places=9)
+                self.assertAlmostEqual(acc.drift_per_day[q], daily["drift"].iloc[0], places=12)
+        # reported quarters carry their end liquidity; the forecast quarter compounds its interest
+        np.testing.assert_allclose(acc.start_liq[1:], acc.carry[:-1])
+        np.testing.assert_allclose(acc.carry, [1800.0, 2950.0, acc.end_liq[2] + acc.interest[2]])
+        self.assertEqual(acc.drift_per_day[2], 0.0)
+
+    def test_parallel_kernel_matches_serial(self):
+        serial = self.terms()
+        with mock.patch.object(im, "PARALLEL_ACCRUAL", True):
+            parallel = self.terms()
+        if hasattr(im._accrual_terms_parallel, "signatures"):  # numba installed: threaded build was used
+            self.assertTrue(im._accrual_terms_parallel.signatures)
+        for field, value in vars(serial).items():
+            with self.subTest(field):
+                np.testing.assert_allclose(getattr(parallel, field), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
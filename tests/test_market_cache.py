@@ -0,0 +1,74 @@
+"""Parquet market-data cache: coverage checks must not paper over holes between fetches."""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import interestmodel as im  # noqa: E402
+
+
+def fake_fred(series, source, start, end):
+    """Business-day DGS3MO that rises 1 bp per calendar day from 2022-01-01."""
+    idx = pd.bdate_range(start, end)
+    return pd.DataFrame({series: 0.1 + (idx - pd.Timestamp("2022-01-01")).days / 100.0}, index=idx)
+
+
+def fake_yahoo(ticker, start=None, end=None, **kwargs):
+    """Daily BTC-USD bars (end exclusive) whose close rises $10 per day from 2022-01-01."""
+    idx = pd.date_range(pd.Timestamp(start), pd.Timestamp(end) - pd.Timedelta(days=1), freq="D")
+    close = 40_000.0 + 10.0 * (idx - pd.Timestamp("2022-01-01")).days.to_numpy()
+    return pd.DataFrame({"Close": close, "High": close, "Low": close, "Open": close}, index=idx)
+
+
+class MarketCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for name, value in {"OUT_DIR": Path(tmp.name), "USE_MARKET_DATA_CACHE": True}.items():
+            patcher = mock.patch.object(im, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_contiguous_cache_is_served_without_refetch(self):
+        with mock.patch("pandas_datareader.data.DataReader", side_effect=fake_fred) as fred:
+            im.fetch_rates(pd.Timestamp("2022-01-01"), pd.Timestamp("2022-06-30"))
+            im.fetch_rates(pd.Timestamp("2022-02-01"), pd.Timestamp("2022-05-31"))
+        self.assertEqual(fred.call_count, 1)
+
+    def test_rates_hole_between_cached_ranges_is_refetched(self):
+        with mock.patch("pandas_datareader.data.DataReader", side_effect=fake_fred) as fred:
+            im.fetch_rates(pd.Timestamp("2022-01-01"), pd.Timestamp("2022-03-01"))
+            im.fetch_rates(pd.Timestamp("2025-01-01"), pd.Timestamp("2025-03-01"))
+            r = im.fetch_rates(pd.Timestamp("2022-01-01"), pd.Timestamp("2025-03-01"))
+        self.assertEqual(fred.call_count, 3)
+        # rates inside the former hole come from FRED, not a forward-fill of March 2022
+        expected = fake_fred("DGS3MO", "fred", "2023-06-01", "2023-06-30")["DGS3MO"]
+        np.testing.assert_allclose(r.loc[expected.index, "rate_pct"], expected)
+
+    def test_rates_cache_is_kept_per_fred_series(self):
+        start, end = pd.Timestamp("2022-01-01"), pd.Timestamp("2022-06-30")
+        with mock.patch("pandas_datareader.data.DataReader", side_effect=fake_fred) as fred:
+            im.fetch_rates(start, end)
+            with mock.patch.object(im, "FRED_SERIES", "DGS1MO"):
+                im.fetch_rates(start, end)
+        self.assertEqual(fred.call_count, 2)
+        self.assertEqual(sorted(p.name for p in im.OUT_DIR.glob("*.parquet")),
+                         ["dgs1mo.parquet", "dgs3mo.parquet"])
+
+    def test_btc_hole_between_cached_ranges_is_refetched(self):
+        with mock.patch("yfinance.download", side_effect=fake_yahoo) as yahoo:
+            im.fetch_btc_prices(pd.Timestamp("2022-01-01"), pd.Timestamp("2022-03-01"))
+            im.fetch_btc_prices(pd.Timestamp("2025-01-01"), pd.Timestamp("2025-03-01"))
+            px = im.fetch_btc_prices(pd.Timestamp("2022-01-01"), pd.Timestamp("2025-03-01"))
+        self.assertEqual(yahoo.call_count, 3)
+        closes = im.prefetch_btc_closes([pd.Timestamp("2023-06-30")], btc_prices=px)
+        self.assertAlmostEqual(float(closes.iloc[0]), 40_000.0 + 10.0 * 545)
+
+
+if __name__ == "__main__":
+    unittest.main()